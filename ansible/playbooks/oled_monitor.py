@@ -16,9 +16,11 @@ Layout:
 
 import time
 import socket
+import functools
 import psutil
 import threading
 import ipaddress
+import numpy as np
 from datetime import datetime
 from zoneinfo import ZoneInfo          # Python 3.9+ (on all Pi OS Bookworm/Ubuntu 22+)
 from PIL import Image, ImageDraw, ImageFont
@@ -33,7 +35,8 @@ I2C_PORT         = 1
 PAGE_FLIP_SEC    = 5
 FRAME_SLEEP      = 0.05
 NET_REFRESH_SEC  = 2
-DATA_REFRESH_SEC = 3
+INET_CHECK_SEC   = 30
+DISK_REFRESH_SEC = 60         # disk usage moves over minutes, not seconds
 DISPLAY_W        = 128
 DISPLAY_H        = 64
 LINE_HEIGHT      = 14
@@ -41,11 +44,26 @@ SCROLL_SPEED     = 1
 SCROLL_GAP       = 28
 TIMEZONE         = ZoneInfo("America/Chicago")   # Dallas / Central Time
 
+# SSD1306 addressing commands — frames are pushed as raw GDDRAM bytes
+SSD1306_COLUMNADDR = 0x21
+SSD1306_PAGEADDR   = 0x22
+DISPLAY_PAGES      = DISPLAY_H // 8
+
 Y_LINE1   = 1
 Y_LINE2   = Y_LINE1 + LINE_HEIGHT
 Y_DIVIDER = Y_LINE2 + LINE_HEIGHT + 1
 Y_LINE3   = Y_DIVIDER + 3
 Y_LINE4   = Y_LINE3 + LINE_HEIGHT
+DOT_X     = DISPLAY_W - 13
+DOT_Y     = DISPLAY_H - 5
+
+# Safe-Y bands — each line's strip is rendered exactly this tall, so a
+# paste can never reach the divider, the next line, or off the screen.
+# Fixed at import time; nothing clips per frame.
+LANE_H1 = min(LINE_HEIGHT, Y_LINE2   - Y_LINE1)
+LANE_H2 = min(LINE_HEIGHT, Y_DIVIDER - Y_LINE2)
+LANE_H3 = min(LINE_HEIGHT, Y_LINE4   - Y_LINE3)
+LANE_H4 = min(LINE_HEIGHT, DISPLAY_H - Y_LINE4)
 
 try:
     font = ImageFont.truetype(
@@ -75,10 +93,29 @@ def get_uptime_str():
 
 # ──────────────────────────────────────────────
 # Dallas time — system clock in America/Chicago timezone
+#
+# Called every frame on page B, so the string is cached per
+# second and built with integer math. The UTC offset is only
+# looked up when the hour rolls over (DST switches on the hour).
 # ──────────────────────────────────────────────
+_time_sec  = -1
+_time_str  = ""
+_tz_hour   = -1
+_tz_offset = 0
+
 def get_dallas_time():
-    now = datetime.now(tz=TIMEZONE)
-    return now.strftime("%H:%M:%S")
+    global _time_sec, _time_str, _tz_hour, _tz_offset
+    sec = int(time.time())
+    if sec == _time_sec:
+        return _time_str
+    if sec // 3600 != _tz_hour:
+        _tz_hour   = sec // 3600
+        _tz_offset = int(datetime.fromtimestamp(sec, tz=TIMEZONE)
+                         .utcoffset().total_seconds())
+    local = sec + _tz_offset
+    _time_sec = sec
+    _time_str = f"{local // 3600 % 24:02d}:{local // 60 % 60:02d}:{local % 60:02d}"
+    return _time_str
 
 
 # ──────────────────────────────────────────────
@@ -115,6 +152,15 @@ def _is_valid_ip(ip_str):
     return True
 
 
+def _is_up(iface):
+    """Read IFF_UP from the /sys flags file — no full psutil.net_if_stats() scan."""
+    try:
+        with open(f"/sys/class/net/{iface}/flags") as f:
+            return int(f.read(), 16) & 0x1 == 0x1
+    except Exception:
+        return True   # unreadable — let the carrier check decide
+
+
 def _has_carrier(iface):
     """Read /sys carrier file. Returns True if cable is physically plugged in."""
     try:
@@ -145,13 +191,12 @@ def _scan_ifaces():
     Sorted: ethernet first, then wireless.
     """
     addrs = psutil.net_if_addrs()
-    stats = psutil.net_if_stats()
     eth, wifi = [], []
 
     for iface, addr_list in addrs.items():
         if iface == "lo":
             continue
-        if iface in stats and not stats[iface].isup:
+        if not _is_up(iface):
             continue
         if not _has_carrier(iface):
             continue
@@ -167,73 +212,110 @@ def _scan_ifaces():
     return eth + wifi
 
 
-def get_active_ip():
-    found = _scan_ifaces()
-    return found[0][1] if found else "No IP"
+def _default_route_iface():
+    """
+    Interface carrying the IPv4 default route (lowest metric wins), read
+    from /proc/net/route — no socket, works offline. None if there isn't one.
+    """
+    best, best_metric = None, None
+    try:
+        with open("/proc/net/route") as f:
+            next(f)                                   # header
+            for line in f:
+                fields = line.split()
+                if fields[1] != "00000000" or not int(fields[3], 16) & 0x1:
+                    continue                          # not default / not RTF_UP
+                metric = int(fields[6])
+                if best_metric is None or metric < best_metric:
+                    best, best_metric = fields[0], metric
+    except Exception:
+        return None
+    return best
+
 
+def get_active_ip(found):
+    """IP of the default-route interface if it's valid, else first eth/wifi."""
+    if not found:
+        return "No IP"
+    default = _default_route_iface()
+    for iface, ip in found:
+        if iface == default:
+            return ip
+    return found[0][1]
 
-def get_network_str():
-    found = _scan_ifaces()
 
+def get_network_str(found):
     if not found:
-        # No valid interface at all — don't even bother checking internet
+        # No valid interface at all — internet state is irrelevant
         return "Net:None [DOWN]"
 
     # Build interface label — show real name(s)
     names     = " ".join(_iface_short(iface) for iface, _ in found)
     iface_str = names if names else "None"
 
-    # Only check internet if we have a real local IP
-    inet = False
-    try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        s.settimeout(1.5)
-        s.connect(("1.1.1.1", 53))
-        s.close()
-        inet = True
-    except Exception:
-        pass
-
-    return f"Net:{iface_str} [{'UP' if inet else 'DOWN'}]"
+    return f"Net:{iface_str} [{'UP' if get_inet_up() else 'DOWN'}]"
 
 
 # ──────────────────────────────────────────────
-# CPU — dedicated sampler thread so nothing
-# interferes with the internal counter
+# Internet probe — own low-frequency thread so the
+# TCP connect never sits in the network refresh path
 # ──────────────────────────────────────────────
-_cpu_pct  = 0.0
-_cpu_lock = threading.Lock()
+_inet_up   = False
+_inet_lock = threading.Lock()
 
-def cpu_sampler_loop():
-    global _cpu_pct
-    psutil.cpu_percent(interval=1)   # warm-up call, result discarded
+def inet_probe_loop():
+    global _inet_up
     while True:
-        val = psutil.cpu_percent(interval=1)
-        with _cpu_lock:
-            _cpu_pct = val
+        try:
+            up = False
+            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            s.settimeout(1.5)          # per-socket, never setdefaulttimeout()
+            try:
+                s.connect(("1.1.1.1", 53))
+                up = True
+            except OSError:
+                pass
+            finally:
+                s.close()
+            with _inet_lock:
+                _inet_up = up
+        except Exception as e:
+            print(f"Internet probe error: {e}")
+        time.sleep(INET_CHECK_SEC)
 
-def get_cpu_pct():
-    with _cpu_lock:
-        return _cpu_pct
+def get_inet_up():
+    with _inet_lock:
+        return _inet_up
 
 
+# ──────────────────────────────────────────────
+# CPU — sampled by its own 1 Hz thread (see
+# cpu_sampler_loop), never from the refresh loops
+# ──────────────────────────────────────────────
+_TEMP_KEYS = ("cpu_thermal", "cpu-thermal", "coretemp")
+_temp_key  = None        # psutil sensor to fall back on; "" once none found
+
 def get_cpu_temp():
+    global _temp_key
     try:
         with open("/sys/class/thermal/thermal_zone0/temp") as f:
             return int(f.read()) / 1000.0
     except Exception:
-        for key in ("cpu_thermal", "cpu-thermal", "coretemp"):
-            t = psutil.sensors_temperatures()
-            if key in t and t[key]:
-                return t[key][0].current
+        pass
+    # Fallback walks /sys/class/hwmon — resolve which sensor exists only once
+    t = psutil.sensors_temperatures() if _temp_key != "" else {}
+    if _temp_key is None:
+        _temp_key = next((k for k in _TEMP_KEYS if t.get(k)), "")
+    if t.get(_temp_key):
+        return t[_temp_key][0].current
     return 0.0
 
 
-def get_cpu_str():
+def get_cpu_str(pct):
     # Fixed-width format keeps characters from bunching:
     #   CPU: XX%  T:XX.XC
     # pct is right-aligned in 3 chars so "2%" shows as " 2%"
-    return f"CPU:{get_cpu_pct():3.0f} %  T:{get_cpu_temp():.1f}°C"
+    return f"CPU:{pct:3.0f} %  T:{get_cpu_temp():.1f}°C"
 
 
 def get_disk():
@@ -255,9 +337,15 @@ def get_ram_label():
 # Data store
 # ──────────────────────────────────────────────
 class DataStore:
+    """
+    Copy-on-write store. Writers build a new dict and rebind _data (an
+    atomic reference swap), so the render loop reads without any lock.
+    The lock only serialises the writer threads against each other.
+    """
     def __init__(self):
-        self._lock = threading.Lock()
-        self._data = {
+        self._lock   = threading.Lock()
+        self.version = 0           # bumped on every real change; read lock-free
+        self._data   = {
             "ip":       "...",
             "hostname": get_hostname(),
             "ram":      get_ram_label(),
@@ -268,11 +356,18 @@ class DataStore:
 
     def update(self, key, value):
         with self._lock:
-            self._data[key] = value
+            if self._data.get(key) != value:
+                data         = dict(self._data)
+                data[key]    = value
+                self._data   = data        # publish before the version bump
+                self.version += 1
 
     def get(self, key):
-        with self._lock:
-            return self._data.get(key, "")
+        return self._data.get(key, "")
+
+    def snapshot(self):
+        """All values from one moment. Never mutated — treat as read-only."""
+        return self._data
 
 store = DataStore()
 
@@ -280,31 +375,88 @@ store = DataStore()
 def network_refresh_loop():
     while True:
         try:
-            store.update("ip",      get_active_ip())
-            store.update("network", get_network_str())
+            found = _scan_ifaces()     # one psutil scan feeds both lines
+            store.update("ip",      get_active_ip(found))
+            store.update("network", get_network_str(found))
         except Exception as e:
             print(f"Net refresh error: {e}")
         time.sleep(NET_REFRESH_SEC)
 
 
+def cpu_sampler_loop():
+    # interval=1 blocks for the sample window, so this thread is the only
+    # caller of cpu_percent() and nothing interferes with its counter
+    psutil.cpu_percent(interval=1)   # warm-up call, result discarded
+    while True:
+        try:
+            store.update("cpu", get_cpu_str(psutil.cpu_percent(interval=1)))
+        except Exception as e:
+            print(f"CPU sampler error: {e}")
+            time.sleep(1)
+
+
 def slow_refresh_loop():
     while True:
         try:
-            store.update("cpu",  get_cpu_str())
             store.update("disk", get_disk())
         except Exception as e:
             print(f"Slow refresh error: {e}")
-        time.sleep(DATA_REFRESH_SEC)
+        time.sleep(DISK_REFRESH_SEC)
 
 
 # ──────────────────────────────────────────────
 # Scroller
 # ──────────────────────────────────────────────
+@functools.lru_cache(maxsize=64)   # bounded: the clock line churns once a second
 def text_px_width(text, f):
     bbox = f.getbbox(text)
     return bbox[2] - bbox[0]
 
+# Glyphs the fixed-width fast path can blit without re-rendering the line
+ATLAS_CHARS = "0123456789:"
+
+@functools.lru_cache(maxsize=256)
+def _fits_cell(c, f):
+    """
+    True if glyph c advances exactly one '0'-wide cell and, rendered in
+    1-bit mode like the strips, inks only inside it. getbbox() measures
+    the anti-aliased glyph, which can be a column narrower than its
+    1-bit raster (e.g. 'R', 'w' in DejaVuSansMono 11), so the ink is
+    measured from an actual mode "1" render.
+    """
+    cw = f.getlength("0")
+    if f.getlength(c) != cw or cw != int(cw):
+        return False
+    cw  = int(cw)
+    img = Image.new("1", (cw * 3, sum(f.getmetrics()) + 2), 0)
+    ImageDraw.Draw(img).text((cw, 0), c, font=f, fill=255)
+    bbox = img.getbbox()
+    return bbox is None or (bbox[0] >= cw and bbox[2] <= 2 * cw)
+
+@functools.lru_cache(maxsize=8)
+def glyph_atlas(f, height):
+    """
+    {char: 0/1 uint8 cell} for ATLAS_CHARS rendered at strip height, or
+    None if f isn't a fixed-pitch font (e.g. the load_default fallback).
+    """
+    try:
+        cw = f.getlength("0")
+        if cw != int(cw) or not all(_fits_cell(c, f) for c in ATLAS_CHARS):
+            return None
+    except Exception:
+        return None
+    cw  = int(cw)
+    img = Image.new("1", (cw * len(ATLAS_CHARS), height), 0)
+    d   = ImageDraw.Draw(img)
+    for i, c in enumerate(ATLAS_CHARS):
+        d.text((i * cw, 0), c, font=f, fill=255)
+    cells = np.array(img, dtype=np.uint8)
+    return {c: cells[:, i * cw:(i + 1) * cw] for i, c in enumerate(ATLAS_CHARS)}
+
 class Scroller:
+    __slots__ = ("offset", "_text", "_font", "_width", "_scrolling",
+                 "_max_h", "_rendered")
+
     def __init__(self, max_height=LINE_HEIGHT):
         self.offset     = 0
         self._text      = ""
@@ -312,16 +464,74 @@ class Scroller:
         self._width     = 0
         self._scrolling = False
         self._max_h     = max_height
+        self._rendered  = np.zeros((max_height, DISPLAY_W), dtype=np.uint8)
+
+    @property
+    def scrolling(self):
+        return self._scrolling
 
     def set(self, text, f=None):
+        """Returns True if the text or font changed (strip re-rendered)."""
         if f is None:
             f = font
         if text != self._text or f != self._font:
+            if f == self._font and self._patch(text):
+                return True
             self._text      = text
             self._font      = f
             self._width     = text_px_width(text, f)
             self._scrolling = self._width > DISPLAY_W
             self.offset     = 0
+            self._render()
+            return True
+        return False
+
+    def _patch(self, text):
+        """
+        Fast path for fixed-width lines such as the clock: if only atlas
+        characters changed, overwrite just those glyph cells in the strip.
+        Returns False when a full re-render is needed instead.
+        """
+        old, f = self._text, self._font
+        if self._scrolling or len(text) != len(old):
+            return False
+        atlas = glyph_atlas(f, self._max_h)
+        if atlas is None:
+            return False
+        cw = atlas["0"].shape[1]
+        if len(text) * cw > DISPLAY_W:
+            return False
+        changed = [i for i in range(len(text)) if text[i] != old[i]]
+        if not all(text[i] in atlas for i in changed):
+            return False
+        # Every glyph must stay inside its cell, or a neighbour's overhang
+        # (or the old glyph) would survive / be clipped by the overwrite
+        if not all(_fits_cell(c, f) for c in text) or \
+           not all(_fits_cell(old[i], f) for i in changed):
+            return False
+        width = text_px_width(text, f)
+        if width > DISPLAY_W:
+            return False
+        strip = self._rendered
+        for i in changed:
+            strip[:, i * cw:(i + 1) * cw] = atlas[text[i]]
+        self._text  = text
+        self._width = width
+        return True
+
+    def _render(self):
+        """Rasterize the text once per change into a 0/1 uint8 strip."""
+        if not self._scrolling:
+            strip = Image.new("1", (DISPLAY_W, self._max_h), 0)
+            ImageDraw.Draw(strip).text((0, 0), self._text, font=self._font, fill=255)
+        else:
+            # Two copies back to back so any DISPLAY_W window wraps seamlessly
+            loop_w = self._width + SCROLL_GAP
+            strip  = Image.new("1", (loop_w * 2, self._max_h), 0)
+            sd     = ImageDraw.Draw(strip)
+            sd.text((0,      0), self._text, font=self._font, fill=255)
+            sd.text((loop_w, 0), self._text, font=self._font, fill=255)
+        self._rendered = np.array(strip, dtype=np.uint8)
 
     def reset(self):
         self.offset = 0
@@ -332,21 +542,86 @@ class Scroller:
             if self.offset >= self._width + SCROLL_GAP:
                 self.offset = 0
 
-    def draw_onto(self, image, y):
-        tmp   = Image.new("1", (DISPLAY_W, self._max_h), 0)
-        tdraw = ImageDraw.Draw(tmp)
-        if not self._scrolling:
-            tdraw.text((0, 0), self._text, font=self._font, fill=255)
-        else:
-            loop_w = self._width + SCROLL_GAP
-            wide   = Image.new("1", (loop_w * 2, self._max_h), 0)
-            wd     = ImageDraw.Draw(wide)
-            wd.text((0,      0), self._text, font=self._font, fill=255)
-            wd.text((loop_w, 0), self._text, font=self._font, fill=255)
-            crop = wide.crop((int(self.offset), 0,
-                              int(self.offset) + DISPLAY_W, self._max_h))
-            tdraw.bitmap((0, 0), crop, fill=255)
-        image.paste(tmp, (0, y))
+    def draw_onto(self, frame, y):
+        """Copy the visible DISPLAY_W window of the strip into its frame lane."""
+        x = int(self.offset)
+        frame[y:y + self._max_h, :] = self._rendered[:, x:x + DISPLAY_W]
+
+
+# ──────────────────────────────────────────────
+# Static chrome — divider and page dots are rasterized once
+# ──────────────────────────────────────────────
+def make_dot_tiles():
+    """
+    Return ([tile_page0, tile_page1], mask) for the two 5x5 page dots as
+    uint8 / bool arrays. The mask covers only the ellipses so copying
+    through it leaves the corner pixels around them untouched, exactly
+    like drawing them.
+    """
+    tiles = []
+    for page in (0, 1):
+        tile = Image.new("1", (11, 5), 0)
+        td   = ImageDraw.Draw(tile)
+        td.ellipse([0, 0, 4,  4], fill=255 if page == 0 else 0, outline=255)
+        td.ellipse([6, 0, 10, 4], fill=255 if page == 1 else 0, outline=255)
+        tiles.append(np.array(tile, dtype=np.uint8))
+    mask = Image.new("1", (11, 5), 0)
+    md   = ImageDraw.Draw(mask)
+    md.ellipse([0, 0, 4,  4], fill=255, outline=255)
+    md.ellipse([6, 0, 10, 4], fill=255, outline=255)
+    return tiles, np.array(mask, dtype=bool)
+
+
+# ──────────────────────────────────────────────
+# Frame push — numpy packs the bitmap straight into
+# SSD1306 GDDRAM order, replacing luma's per-pixel loop
+# ──────────────────────────────────────────────
+def frame_to_pages(frame):
+    """
+    Pack a DISPLAY_H x DISPLAY_W 0/1 uint8 frame into SSD1306 page layout:
+    DISPLAY_PAGES rows of DISPLAY_W bytes, one byte per 8-pixel column,
+    LSB = top pixel of the page.
+    """
+    bits = frame.reshape(DISPLAY_PAGES, 8, DISPLAY_W)
+    return np.packbits(bits, axis=1, bitorder="little").reshape(DISPLAY_PAGES, DISPLAY_W)
+
+
+def push_pages(device, pages, prev=None):
+    """
+    Send only the rectangle of GDDRAM that differs from prev (the last
+    frame sent). With prev=None the whole screen goes out, using the same
+    address window luma's ssd1306.display() sets. Returns False if there
+    was nothing to send.
+
+    The SSD1306 wraps horizontal-mode writes inside the column/page window,
+    so a bounding box of changed pages x changed columns is one transfer.
+    """
+    if prev is None:
+        p0, p1, c0, c1 = 0, DISPLAY_PAGES - 1, 0, DISPLAY_W - 1
+    else:
+        diff = pages != prev
+        rows = np.flatnonzero(diff.any(axis=1))
+        if rows.size == 0:
+            return False
+        cols = np.flatnonzero(diff.any(axis=0))
+        p0, p1, c0, c1 = rows[0], rows[-1], cols[0], cols[-1]
+    device.command(SSD1306_COLUMNADDR, int(c0), int(c1),
+                   SSD1306_PAGEADDR,   int(p0), int(p1))
+    device.data(pages[p0:p1 + 1, c0:c1 + 1].ravel().tolist())
+    return True
+
+
+def get_i2c_clock_hz(port=I2C_PORT):
+    """
+    Effective I2C bus speed from the device tree (big-endian u32), i.e.
+    what dtparam=i2c_arm_baudrate actually gave us. None if unreadable.
+    The of_node link lives on the adapter, not on the i2c-dev char device.
+    """
+    try:
+        with open(f"/sys/class/i2c-adapter/i2c-{port}/of_node/clock-frequency", "rb") as f:
+            return int.from_bytes(f.read(4), "big")
+    except Exception:
+        return None
 
 
 # ──────────────────────────────────────────────
@@ -354,59 +629,105 @@ class Scroller:
 # ──────────────────────────────────────────────
 def main():
     print(f"Starting OLED monitor — I2C {hex(I2C_ADDRESS)}")
+    hz = get_i2c_clock_hz()
+    print(f"I2C bus {I2C_PORT} clock: " + (f"{hz // 1000} kHz" if hz else "unknown"))
     serial = i2c(port=I2C_PORT, address=I2C_ADDRESS)
-    device = ssd1306(serial)
+    # luma only initialises the panel; frames bypass device.display() and
+    # canvas() (push_pages), so pin the geometry that packing assumes
+    device = ssd1306(serial, width=DISPLAY_W, height=DISPLAY_H)
     device.contrast(200)
 
-    s1 = Scroller(max_height=LINE_HEIGHT)
-    s2 = Scroller(max_height=LINE_HEIGHT)
-    s3 = Scroller(max_height=LINE_HEIGHT)
-    s4 = Scroller(max_height=LINE_HEIGHT)
+    s1 = Scroller(max_height=LANE_H1)
+    s2 = Scroller(max_height=LANE_H2)
+    s3 = Scroller(max_height=LANE_H3)
+    s4 = Scroller(max_height=LANE_H4)
 
     threading.Thread(target=cpu_sampler_loop,     daemon=True).start()
+    threading.Thread(target=inet_probe_loop,      daemon=True).start()
     threading.Thread(target=network_refresh_loop, daemon=True).start()
     threading.Thread(target=slow_refresh_loop,    daemon=True).start()
 
-    last_page = -1
+    last_page    = -1
+    last_version = -1
+    last_sec     = -1
+    last_pages   = None
+
+    # One 0/1 frame array for the life of the process. Each scroller strip
+    # repaints its whole lane, so the buffer is never cleared and the
+    # divider is set in it exactly once.
+    frame = np.zeros((DISPLAY_H, DISPLAY_W), dtype=np.uint8)
+    frame[Y_DIVIDER, :] = 1
+    dot_tiles, dot_mask = make_dot_tiles()
+    dot_area = frame[DOT_Y:DOT_Y + 5, DOT_X:DOT_X + 11]
+
+    # Hot-loop aliases: locals are LOAD_FAST, globals/attributes are not
+    wall, mono, sleep = time.time, time.monotonic, time.sleep
+    snapshot, copyto  = store.snapshot, np.copyto
+    draws = ((s1.draw_onto, Y_LINE1), (s2.draw_onto, Y_LINE2),
+             (s3.draw_onto, Y_LINE3), (s4.draw_onto, Y_LINE4))
+    ticks = (s1.tick, s2.tick, s3.tick, s4.tick)
+
+    # Sleep to a fixed deadline so frame cadence doesn't drift with load
+    next_frame = mono()
 
     try:
         while True:
-            page = int(time.time() / PAGE_FLIP_SEC) % 2
+            now     = wall()
+            page    = int(now / PAGE_FLIP_SEC) % 2
+            version = store.version
+
+            # Only re-read the store when a refresh changed something
+            dirty = page != last_page or version != last_version
 
             if page != last_page:
                 s3.reset()
                 s4.reset()
                 last_page = page
 
-            s1.set(f"IP:{store.get('ip')}",                        font_bold)
-            s2.set(f"{store.get('hostname')}  {store.get('ram')}", font)
-
-            if page == 0:
-                s3.set(store.get("cpu"),     font)
-                s4.set(store.get("network"), font)
+            if dirty:
+                snap = snapshot()
+                s1.set(f"IP:{snap['ip']}",                   font_bold)
+                s2.set(f"{snap['hostname']}  {snap['ram']}", font)
+                if page == 0:
+                    s3.set(snap["cpu"],     font)
+                    s4.set(snap["network"], font)
+                else:
+                    s3.set(snap["disk"],    font)
+                last_version = version
+
+            # Clock line only changes once a second; the glyph-atlas fast path
+            # in Scroller.set() then patches just the changed digits
+            if page == 1:
+                sec = int(now)
+                if sec != last_sec or dirty:
+                    dirty |= s4.set(f"{get_dallas_time()}  up:{get_uptime_str()}", font)
+                    last_sec = sec
+
+            dirty |= s1.scrolling or s2.scrolling or s3.scrolling or s4.scrolling
+
+            if dirty:
+                for draw_onto, y in draws:
+                    draw_onto(frame, y)
+
+                # Line 4's lane dips into the dot rows, so the dots go back on
+                # top whenever it is repainted (and that covers page flips)
+                copyto(dot_area, dot_tiles[page], where=dot_mask)
+
+                # The I2C push is the expensive part — only changed pages/columns
+                # go over the bus, and identical frames send nothing
+                pages = frame_to_pages(frame)
+                push_pages(device, pages, last_pages)
+                last_pages = pages
+
+            for tick in ticks:
+                tick()
+
+            next_frame += FRAME_SLEEP
+            delay = next_frame - mono()
+            if delay > 0:
+                sleep(delay)
             else:
-                s3.set(store.get("disk"),    font)
-                s4.set(f"{get_dallas_time()}  up:{get_uptime_str()}", font)
-
-            image = Image.new("1", (DISPLAY_W, DISPLAY_H), 0)
-            s1.draw_onto(image, Y_LINE1)
-            s2.draw_onto(image, Y_LINE2)
-            s3.draw_onto(image, Y_LINE3)
-            s4.draw_onto(image, Y_LINE4)
-
-            # Divider drawn LAST
-            draw = ImageDraw.Draw(image)
-            draw.line([(0, Y_DIVIDER), (DISPLAY_W, Y_DIVIDER)], fill=255)
-
-            dot_y = DISPLAY_H - 5
-            draw.ellipse([DISPLAY_W-13, dot_y, DISPLAY_W-9,  dot_y+4],
-                         fill=255 if page == 0 else 0, outline=255)
-            draw.ellipse([DISPLAY_W-7,  dot_y, DISPLAY_W-3,  dot_y+4],
-                         fill=255 if page == 1 else 0, outline=255)
-
-            device.display(image)
-            s1.tick(); s2.tick(); s3.tick(); s4.tick()
-            time.sleep(FRAME_SLEEP)
+                next_frame = mono()   # fell behind — don't try to catch up
 
     except KeyboardInterrupt:
         device.clear()
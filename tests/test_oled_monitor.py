@@ -0,0 +1,75 @@
+"""
+Checks for oled_monitor.py that need no OLED hardware.
+
+luma is only used inside main(), so it is replaced with empty stand-in
+modules when it isn't installed (e.g. on a dev machine).
+"""
+
+import importlib.util
+import pathlib
+import random
+import sys
+import types
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("PIL")
+pytest.importorskip("psutil")
+
+SCRIPT = pathlib.Path(__file__).resolve().parents[1] / "ansible" / "playbooks" / "oled_monitor.py"
+
+
+@pytest.fixture(scope="module")
+def om():
+    try:
+        import luma.oled.device  # noqa: F401
+        import luma.core.interface.serial  # noqa: F401
+    except ImportError:
+        for name in ("luma", "luma.core", "luma.core.interface",
+                     "luma.core.interface.serial", "luma.oled", "luma.oled.device"):
+            sys.modules.setdefault(name, types.ModuleType(name))
+        sys.modules["luma.core.interface.serial"].i2c = None
+        sys.modules["luma.oled.device"].ssd1306 = None
+    spec = importlib.util.spec_from_file_location("oled_monitor", SCRIPT)
+    mod  = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _full(om, text, f):
+    s = om.Scroller(max_height=om.LANE_H4)
+    s.set(text, f)
+    return s._rendered
+
+
+@pytest.mark.parametrize("before, after", [
+    ("R", "1"),
+    ("hRwAr", "h6wAr"),
+    ("w1w", "w2w"),
+    ("12:34:56  up:3h4m", "12:34:57  up:3h4m"),
+    ("12:59:59  up:3h4m", "13:00:00  up:3h5m"),
+])
+def test_glyph_patch_matches_full_render(om, before, after):
+    for f in (om.font, om.font_bold):
+        s = om.Scroller(max_height=om.LANE_H4)
+        s.set(before, f)
+        s.set(after, f)
+        assert np.array_equal(s._rendered, _full(om, after, f))
+
+
+def test_glyph_patch_fuzz(om):
+    rng   = random.Random(1234)
+    chars = "0123456789:" + "RwKS2AhmpuT% .°C"
+    for f in (om.font, om.font_bold):
+        s = om.Scroller(max_height=om.LANE_H4)
+        for _ in range(2000):
+            text = "".join(rng.choice(chars) for _ in range(rng.randint(1, 8)))
+            # Mostly digit-only edits of the previous text, to exercise _patch
+            if s._text and rng.random() < 0.8:
+                cells = list(s._text)
+                i = rng.randrange(len(cells))
+                cells[i] = rng.choice("0123456789:")
+                text = "".join(cells)
+            s.set(text, f)
+            assert np.array_equal(s._rendered, _full(om, text, f)), (text,)